@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Persistent gytmdl worker for batch downloads
+
+Imports gytmdl once, then reads one URL per line from stdin and emits one
+JSON status line ({"url": ..., "rc": ...}) per completed download. This
+amortizes Python interpreter startup and gytmdl import cost across a whole
+batch instead of paying it for every URL.
+
+Usage: python gytmdl_batch_worker.py <config-path>
+"""
+
+import json
+import os
+import sys
+
+
+def main():
+    if len(sys.argv) < 2:
+        print('Usage: gytmdl_batch_worker.py <config-path>', file=sys.stderr)
+        return 2
+
+    config_path = sys.argv[1]
+
+    # Reserve the real stdout for the JSON status channel and point fd 1 at
+    # stderr, so gytmdl/yt-dlp progress output can't corrupt the protocol
+    status = os.fdopen(os.dup(sys.stdout.fileno()), 'w')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    from gytmdl.cli import main as gytmdl_main
+
+    for line in sys.stdin:
+        url = line.strip()
+        if not url:
+            continue
+        rc = 0
+        try:
+            gytmdl_main.main(
+                args=['--config-path', config_path, url],
+                standalone_mode=False,
+            )
+        except SystemExit as e:
+            rc = int(e.code or 0)
+        except Exception:
+            rc = 1
+        status.write(json.dumps({'url': url, 'rc': rc}) + '\n')
+        status.flush()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
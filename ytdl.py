@@ -11,37 +11,69 @@ Features:
 - Server health monitoring
 """
 
+import asyncio
+import atexit
+import io
 import os
 import sys
 import time
 import subprocess
+import tempfile
 import psutil
 import json
+import mmap
+import select
 import shutil
+import stat
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict
 
+# Repo root and config dir, resolved once at import time; every command and
+# download path needs them and re-resolving per call is wasted syscalls
+ROOT_DIR = Path(__file__).resolve().parent
+CONFIG_DIR = ROOT_DIR / 'config'
+
+# requests is only needed for server health checks; fail soft if missing
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+# Emit ANSI colors only when stdout is a terminal; honors the NO_COLOR
+# convention (https://no-color.org). Plain prefixes keep piped/CI logs
+# free of escape-sequence noise.
+_USE_COLOR = sys.stdout.isatty() and os.environ.get('NO_COLOR') is None
+
+# Prebuilt log prefixes so the hot log calls don't rebuild the same escape
+# sequences on every message
+_INFO_PREFIX = '[\033[36mINFO\033[0m] ' if _USE_COLOR else '[INFO] '
+_SUCCESS_PREFIX = '[\033[32mSUCCESS\033[0m] ' if _USE_COLOR else '[SUCCESS] '
+_WARN_PREFIX = '[\033[33mWARN\033[0m] ' if _USE_COLOR else '[WARN] '
+_ERROR_PREFIX = '[\033[31mERROR\033[0m] ' if _USE_COLOR else '[ERROR] '
+
 def log_info(message: str):
     """Print info message with color"""
-    print(f'[\033[36mINFO\033[0m] {message}')
+    sys.stdout.write(_INFO_PREFIX + message + '\n')
 
 def log_success(message: str):
     """Print success message with color"""
-    print(f'[\033[32mSUCCESS\033[0m] {message}')
+    sys.stdout.write(_SUCCESS_PREFIX + message + '\n')
 
 def log_warn(message: str):
     """Print warning message with color"""
-    print(f'[\033[33mWARN\033[0m] {message}')
+    sys.stdout.write(_WARN_PREFIX + message + '\n')
 
 def log_error(message: str):
     """Print error message with color"""
-    print(f'[\033[31mERROR\033[0m] {message}')
+    sys.stdout.write(_ERROR_PREFIX + message + '\n')
 
 def check_dependencies() -> Dict[str, bool]:
     """Check if all required dependencies are available"""
@@ -66,33 +98,136 @@ def print_dependency_status():
 # SERVER MANAGEMENT
 # ============================================================================
 
+# Cached PID of the last server process we found, so repeat checks (batch
+# downloads call this once per URL) don't re-scan the whole process table
+_SERVER_PID_CACHE: Optional[int] = None
+
+
+def _server_pid_file() -> Path:
+    """Path of the pidfile written when we start the server"""
+    return ROOT_DIR / 'bgutil-pot-provider' / 'server' / '.pid'
+
+
+def _write_server_pid(pid: int):
+    """Record the server PID so later checks can skip the process scan"""
+    try:
+        _server_pid_file().write_text(str(pid), encoding='utf-8')
+    except OSError:
+        pass  # pidfile is an optimization, not a requirement
+
+
+def _validate_server_pid(pid: int) -> bool:
+    """Cheap identity check: is this PID the node process running main.js?"""
+    try:
+        proc = psutil.Process(pid)
+        if proc.name() not in ('node.exe', 'node'):
+            return False
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return False
+    # Name alone isn't identity: a recycled PID could be any node process,
+    # so confirm it is actually running the PO token server
+    try:
+        return any('main.js' in cmd for cmd in proc.cmdline())
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return False
+
+
 def is_server_running():
     """Check if PO token server is already running"""
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+    global _SERVER_PID_CACHE
+
+    # Fast path 1: validate the cached PID before touching disk
+    if _SERVER_PID_CACHE is not None:
+        if _validate_server_pid(_SERVER_PID_CACHE):
+            return _SERVER_PID_CACHE
+        _SERVER_PID_CACHE = None
+
+    # Fast path 2: pidfile left by a previous start_server() run
+    try:
+        pid = int(_server_pid_file().read_text(encoding='utf-8').strip())
+        if _validate_server_pid(pid):
+            _SERVER_PID_CACHE = pid
+            return pid
+    except (OSError, ValueError):
+        pass
+
+    # Cold fallback: full scan, but only fetch cmdline for node processes
+    for proc in psutil.process_iter(['name']):
+        if proc.info['name'] not in ('node.exe', 'node'):
+            continue
         try:
-            if proc.info['name'] in ('node.exe', 'node'):
-                cmdline = proc.info['cmdline']
-                if cmdline and any('main.js' in cmd for cmd in cmdline):
-                    return proc.info['pid']
+            if any('main.js' in cmd for cmd in proc.cmdline()):
+                _SERVER_PID_CACHE = proc.pid
+                _write_server_pid(_SERVER_PID_CACHE)
+                return _SERVER_PID_CACHE
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
     return None
 
 
+# Shared HTTP session for health checks, created lazily. Keep-alive reuses
+# the TCP connection to the local server instead of reconnecting per ping.
+_http_session = None
+
+
+def _get_session():
+    """Get (or create) the shared requests.Session for health checks"""
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+        _http_session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        atexit.register(_http_session.close)
+    return _http_session
+
+
 def check_server_health():
     """Check if server is responding"""
+    if requests is None:
+        return False
     try:
-        import requests
-        response = requests.get('http://127.0.0.1:4416/ping', timeout=1)
+        response = _get_session().get('http://127.0.0.1:4416/ping', timeout=1)
         return response.status_code == 200
     except:
         return False
 
 
+def _wait_for_server(process, timeout: float = 2.0) -> bool:
+    """Poll the health endpoint until the server answers or timeout expires
+
+    Returns as soon as the server responds instead of sleeping a fixed
+    interval. On Linux a pidfd on the child lets us bail out immediately
+    if the server process dies during startup.
+    """
+    pidfd = None
+    poller = None
+    if hasattr(os, 'pidfd_open'):
+        try:
+            pidfd = os.pidfd_open(process.pid)
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+        except OSError:
+            pidfd = None
+            poller = None
+
+    try:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if check_server_health():
+                return True
+            if poller is not None:
+                if poller.poll(50):
+                    return False  # pidfd readable: child exited
+            else:
+                time.sleep(0.05)
+        return check_server_health()
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
+
 def start_server():
     """Start PO token server"""
-    root_dir = Path(__file__).parent.absolute()
-    server_path = root_dir / 'bgutil-pot-provider' / 'server' / 'build' / 'main.js'
+    server_path = ROOT_DIR / 'bgutil-pot-provider' / 'server' / 'build' / 'main.js'
     
     # Check if already running
     pid = is_server_running()
@@ -125,7 +260,7 @@ def start_server():
             startupinfo.wShowWindow = 0
             process = subprocess.Popen(
                 ['node', str(server_path)],
-                cwd=str(root_dir),
+                cwd=str(ROOT_DIR),
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 startupinfo=startupinfo,
@@ -134,17 +269,20 @@ def start_server():
         else:
             process = subprocess.Popen(
                 ['nohup', 'node', str(server_path)],
-                cwd=str(root_dir),
+                cwd=str(ROOT_DIR),
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 preexec_fn=os.setpgrp
             )
-        
-        time.sleep(2)
-        
-        if check_server_health():
+
+        _write_server_pid(process.pid)
+
+        if _wait_for_server(process):
             log_success(f'PO token server started successfully (PID: {process.pid})')
             return 0
+        elif process.poll() is not None:
+            log_error(f'Server process exited during startup (code: {process.returncode})')
+            return 1
         else:
             log_warn('Server started but not responding yet, may need a moment...')
             return 0
@@ -162,26 +300,32 @@ def start_server():
 # PROFILE MANAGEMENT
 # ============================================================================
 
+def _scan_json_files(directory) -> List[str]:
+    """List names of .json files in a directory (no extension, no stat per entry)"""
+    names = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith('.json'):
+                    names.append(entry.name[:-5])
+    except OSError:
+        pass
+    return names
+
+
 def get_available_profiles(root_dir):
     """Get list of available configuration profiles"""
-    profiles = []
     config_dir = root_dir / 'config'
-    
-    for config_file in config_dir.glob('*.json'):
-        profiles.append(config_file.stem)
-    
-    profiles_dir = config_dir / 'profiles'
-    if profiles_dir.exists():
-        for config_file in profiles_dir.glob('*.json'):
-            profiles.append(f'profiles/{config_file.stem}')
-    
+
+    profiles = _scan_json_files(config_dir)
+    profiles.extend(f'profiles/{name}' for name in _scan_json_files(config_dir / 'profiles'))
+
     return sorted(profiles)
 
 
 def list_profiles():
     """List all available profiles"""
-    root_dir = Path(__file__).parent.absolute()
-    profiles = get_available_profiles(root_dir)
+    profiles = get_available_profiles(ROOT_DIR)
     
     print('\n\033[36mAvailable Profiles:\033[0m')
     print('\n\033[33mMain Configs:\033[0m')
@@ -206,18 +350,38 @@ def backup_config(config_path: Path) -> Optional[Path]:
         backup_dir = config_path.parent.parent / 'backups' / 'configs'
         backup_dir.mkdir(parents=True, exist_ok=True)
         backup_path = backup_dir / f'{config_path.stem}_backup.json'
-        shutil.copy2(config_path, backup_path)
+        # Prefer a hardlink: metadata-only, no data copied. Safe because the
+        # writer replaces the config atomically rather than rewriting it in
+        # place. Fall back to a real copy across filesystems.
+        try:
+            backup_path.unlink(missing_ok=True)
+            os.link(config_path, backup_path)
+        except OSError:
+            shutil.copy2(config_path, backup_path)
         return backup_path
     except Exception as e:
         log_warn(f'Could not backup config: {e}')
         return None
 
+# Byte markers that mean a config needs fixing; checked with C-level
+# substring search before any JSON parsing happens
+_ARIA2C_MARKER = b'"aria2c"'
+_DATE_TEMPLATE_MARKER = b'{date:%Y}'
+
+
 def fix_config_if_needed(config_path: Path, create_backup: bool = True) -> bool:
     """Fix config file if it has issues (aria2c, template formats, etc.)"""
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
+        raw = Path(config_path).read_bytes()
+
+        # Cheap substring check on the raw bytes first: if neither problem
+        # marker is present there is nothing to fix, so skip the JSON
+        # round-trip entirely (the common case for fix-all)
+        if _ARIA2C_MARKER not in raw and _DATE_TEMPLATE_MARKER not in raw:
+            return False
+
+        config = json.loads(raw)
+
         fixed = False
         fixes_applied = []
         
@@ -245,41 +409,157 @@ def fix_config_if_needed(config_path: Path, create_backup: bool = True) -> bool:
                 fixes_applied.append('fixed date template')
                 fixed = True
         
-        # Write back the fixed config
+        # Write back the fixed config atomically: serialize once, write to
+        # a tempfile in the same directory, then replace. A crash mid-write
+        # can no longer destroy the config, and the hardlinked backup keeps
+        # pointing at the old inode.
         if fixed:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            payload = json.dumps(config, indent=2).encode('utf-8')
+            fd, tmp_path = tempfile.mkstemp(
+                dir=str(config_path.parent), prefix='.tmp-', suffix='.json')
+            try:
+                # mkstemp creates the file as 0600; carry over the original
+                # mode so the replaced config keeps its permissions
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(config_path).st_mode))
+                try:
+                    os.write(fd, payload)
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, config_path)
+            except OSError:
+                # Don't leak a .tmp-*.json for _scan_json_files to pick up
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
             return True
     except Exception as e:
         log_warn(f'Could not fix config: {e}')
     
     return False
 
-def download_single(url: str, profile: str = 'gytmdl', auto_fix: bool = True, max_retries: int = 2) -> int:
+# Environment for gytmdl child processes, built once at import instead of
+# copying the full os.environ on every download
+_BASE_ENV = {
+    **os.environ,
+    'PYTHONIOENCODING': 'utf-8',
+    'PYTHONDONTWRITEBYTECODE': '1',  # skip .pyc writes in the child
+    'PYTHONUNBUFFERED': '1',
+}
+
+
+def _resolve_python(root_dir: Path) -> Optional[Path]:
+    """Find the Python to run gytmdl with: venv first, then system Python"""
+    venv_python = root_dir / 'env' / 'Scripts' / 'python.exe'
+    if not venv_python.exists():
+        venv_python = root_dir / 'env' / 'bin' / 'python'
+
+    if venv_python.exists():
+        return venv_python
+
+    # If no venv exists, use system Python (e.g., in container)
+    result = subprocess.run(
+        [sys.executable, '-c', 'import gytmdl'],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode == 0:
+        log_info('Using system Python (container mode)')
+        return Path(sys.executable)
+
+    log_error('Virtual environment not found and gytmdl not installed')
+    log_info('Run: python -m venv env')
+    return None
+
+
+def _spawn_gytmdl_worker(venv_python: Path, config_path: Path, env: Dict[str, str]):
+    """Start the persistent gytmdl worker, or return None if unavailable
+
+    The worker (gytmdl_batch_worker.py) imports gytmdl once and handles one
+    URL per stdin line, so a batch pays interpreter startup and module
+    import cost a single time instead of once per URL.
+    """
+    shim = ROOT_DIR / 'gytmdl_batch_worker.py'
+    if not shim.exists():
+        return None
+    try:
+        return subprocess.Popen(
+            [str(venv_python), str(shim), str(config_path)],
+            cwd=str(shim.parent),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            env=env,
+        )
+    except OSError as e:
+        log_warn(f'Could not start batch worker, falling back to per-URL runs: {e}')
+        return None
+
+
+def _worker_download(worker, url: str, max_retries: int = 2) -> Optional[int]:
+    """Send one URL to the worker, retrying failures like download_single
+
+    Returns the download's return code, or None if the worker died (caller
+    should fall back to per-URL subprocess runs).
+    """
+    returncode = None
+    for attempt in range(max_retries + 1):
+        if attempt > 0:
+            log_warn(f'Retry attempt {attempt}/{max_retries}...')
+            time.sleep(2)  # Wait before retry
+        try:
+            worker.stdin.write(url + '\n')
+            worker.stdin.flush()
+            line = worker.stdout.readline()
+            if not line:
+                return None
+            returncode = int(json.loads(line).get('rc', 1))
+        except (OSError, ValueError):
+            return None
+        if returncode == 0:
+            return 0
+    log_error(f'Download failed after {max_retries + 1} attempts')
+    return returncode
+
+
+def _shutdown_worker(worker):
+    """Close the worker's stdin and let it exit cleanly"""
+    if worker is None:
+        return
+    try:
+        worker.stdin.close()
+        worker.wait(timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        worker.terminate()
+
+
+def download_single(url: str, profile: str = 'gytmdl', auto_fix: bool = True, max_retries: int = 2,
+                    _server_ready: bool = False) -> int:
     """Download single URL with retry logic
-    
+
     Args:
         url: YouTube Music URL to download
         profile: Config profile to use
         auto_fix: Auto-fix aria2c issues
         max_retries: Number of retry attempts on failure
-    
+        _server_ready: Skip the server check (batch mode starts it once up front)
+
     Returns:
         0 on success, non-zero on failure
     """
-    root_dir = Path(__file__).parent.absolute()
-    os.chdir(root_dir)
-    
-    # Start server
-    log_info('Checking PO token server...')
-    start_server()
+    # Start server (unless the caller already did)
+    if not _server_ready:
+        log_info('Checking PO token server...')
+        start_server()
     
     # Build config path
-    config_path = root_dir / 'config' / f'{profile}.json'
+    config_path = CONFIG_DIR / f'{profile}.json'
     if not config_path.exists():
         log_error(f'Profile not found: {config_path}')
         print(f'\n\033[33mAvailable profiles:\033[0m')
-        for p in get_available_profiles(root_dir):
+        for p in get_available_profiles(ROOT_DIR):
             print(f'  \033[32m-\033[0m {p}')
         return 1
     
@@ -289,42 +569,28 @@ def download_single(url: str, profile: str = 'gytmdl', auto_fix: bool = True, ma
             log_info('Auto-fixed config: removed aria2c mode (using default for better compatibility)')
     
     # Determine Python executable (venv or system)
-    venv_python = root_dir / 'env' / 'Scripts' / 'python.exe'
-    if not venv_python.exists():
-        venv_python = root_dir / 'env' / 'bin' / 'python'
-    
-    # If no venv exists, use system Python (e.g., in container)
-    if not venv_python.exists():
-        # Check if gytmdl is available in system Python
-        result = subprocess.run(
-            [sys.executable, '-c', 'import gytmdl'],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            venv_python = Path(sys.executable)
-            log_info('Using system Python (container mode)')
-        else:
-            log_error('Virtual environment not found and gytmdl not installed')
-            log_info('Run: python -m venv env')
-            return 1
-    
+    venv_python = _resolve_python(ROOT_DIR)
+    if venv_python is None:
+        return 1
+
     log_success(f'Using profile: {profile}')
     log_info(f'Downloading: {url}')
     
-    env = os.environ.copy()
-    env['PYTHONIOENCODING'] = 'utf-8'
-    
+    # Resolve the command once before the retry loop: prefer the gytmdl
+    # console script (skips the -m module lookup), fall back to python -m
+    gytmdl_exe = venv_python.parent / ('gytmdl.exe' if sys.platform == 'win32' else 'gytmdl')
+    if gytmdl_exe.exists():
+        cmd = [str(gytmdl_exe), '--config-path', str(config_path), url]
+    else:
+        cmd = [str(venv_python), '-m', 'gytmdl', '--config-path', str(config_path), url]
+
     # Retry logic
     for attempt in range(max_retries + 1):
         if attempt > 0:
             log_warn(f'Retry attempt {attempt}/{max_retries}...')
             time.sleep(2)  # Wait before retry
-        
-        result = subprocess.run(
-            [str(venv_python), '-m', 'gytmdl', '--config-path', str(config_path), url],
-            env=env
-        )
+
+        result = subprocess.run(cmd, cwd=str(ROOT_DIR), env=_BASE_ENV)
         
         if result.returncode == 0:
             return 0
@@ -333,14 +599,60 @@ def download_single(url: str, profile: str = 'gytmdl', auto_fix: bool = True, ma
     return result.returncode
 
 
-def download_batch(list_file: str, profile: str = 'gytmdl', continue_on_error: bool = True) -> int:
+async def _download_urls_async(urls, venv_python: Path, config_path: Path,
+                               env: Dict[str, str], root_dir: Path,
+                               max_concurrent: int, results: list,
+                               max_retries: int = 2):
+    """Download URLs concurrently with a bounded number of gytmdl children
+
+    Downloads are I/O-bound (network fetch + disk write in the child), so
+    overlapping them hides most of the network wait. Child output goes to
+    DEVNULL since interleaved progress from several downloads is unreadable.
+    Each URL gets the same retry budget as the serial path.
+
+    Appends (line_num, url, returncode) tuples to the caller-owned results
+    list in completion order, so completed downloads are still accounted
+    for if the batch is interrupted.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def run_one(line_num: int, url: str):
+        async with semaphore:
+            log_info(f'Downloading: {url[:60]}...' if len(url) > 60 else f'Downloading: {url}')
+            for attempt in range(max_retries + 1):
+                if attempt > 0:
+                    log_warn(f'Retry attempt {attempt}/{max_retries}: {url[:50]}...')
+                    await asyncio.sleep(2)  # Wait before retry
+                proc = await asyncio.create_subprocess_exec(
+                    str(venv_python), '-m', 'gytmdl',
+                    '--config-path', str(config_path), url,
+                    cwd=str(root_dir),
+                    env=env,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+                returncode = await proc.wait()
+                if returncode == 0:
+                    break
+            if returncode == 0:
+                log_success(f'Downloaded: {url[:50]}...' if len(url) > 50 else f'Downloaded: {url}')
+            else:
+                log_error(f'Failed to download: {url[:50]}...' if len(url) > 50 else f'Failed to download: {url}')
+            results.append((line_num, url, returncode))
+
+    await asyncio.gather(*(run_one(line_num, url) for line_num, url in urls))
+
+
+def download_batch(list_file: str, profile: str = 'gytmdl', continue_on_error: bool = True,
+                   jobs: int = 1) -> int:
     """Batch download from URL list with progress tracking
-    
+
     Args:
         list_file: Path to text file containing URLs
         profile: Config profile to use
         continue_on_error: Continue downloading even if some URLs fail
-    
+        jobs: Number of concurrent downloads (1 = serial with progress output)
+
     Returns:
         0 if all successful, 1 if any failures
     """
@@ -354,14 +666,17 @@ def download_batch(list_file: str, profile: str = 'gytmdl', continue_on_error: b
     log_info('Starting batch download...')
     start_server()
     
-    # Read URLs
+    # Read URLs: mmap the whole file and split at the bytes level, which
+    # keeps the line scan in C instead of a Python-level readline loop
     urls = []
-    with open(list_path, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            urls.append((line_num, line))
+    with open(list_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for line_num, line in enumerate(data.read().split(b'\n'), 1):
+                    line = line.strip()
+                    if not line or line.startswith(b'#'):
+                        continue
+                    urls.append((line_num, line.decode('utf-8')))
     
     if not urls:
         log_warn(f'No URLs found in {list_file}')
@@ -371,37 +686,79 @@ def download_batch(list_file: str, profile: str = 'gytmdl', continue_on_error: b
     success_count = 0
     fail_count = 0
     failed_urls = []
-    
+
     log_info(f'Found {total_urls} URL(s) to download')
     print()
-    
-    # Process each URL
-    for index, (line_num, url) in enumerate(urls, 1):
-        print('\n' + '=' * 70)
-        print(f'\033[33m[{index}/{total_urls}] Line {line_num}: {url[:60]}...\033[0m' if len(url) > 60 else f'\033[33m[{index}/{total_urls}] Line {line_num}: {url}\033[0m')
-        print('=' * 70)
-        
+
+    # Resolve the config and interpreter once for the whole batch
+    config_path = CONFIG_DIR / f'{profile}.json'
+    venv_python = None
+    if config_path.exists():
+        if fix_config_if_needed(config_path):
+            log_info('Auto-fixed config: removed aria2c mode (using default for better compatibility)')
+        venv_python = _resolve_python(ROOT_DIR)
+
+    if jobs > 1 and venv_python is not None:
+        # Concurrent mode: overlap the network-bound downloads
+        log_info(f'Downloading with {jobs} concurrent job(s)')
+        # The coroutine appends into this list, so downloads that finished
+        # before an interrupt still show up in the summary
+        results = []
         try:
-            result = download_single(url, profile)
-            if result == 0:
+            asyncio.run(_download_urls_async(
+                urls, venv_python, config_path, _BASE_ENV, ROOT_DIR, jobs, results))
+        except KeyboardInterrupt:
+            log_warn('Batch download interrupted by user')
+        for line_num, url, returncode in results:
+            if returncode == 0:
                 success_count += 1
-                log_success(f'Downloaded: {url[:50]}...')
             else:
                 fail_count += 1
                 failed_urls.append((line_num, url))
-                log_error(f'Failed to download: {url[:50]}...')
+    else:
+        # Serial mode: try the persistent gytmdl worker so interpreter
+        # startup and gytmdl import are paid once for the whole batch, not
+        # once per URL. Falls back to per-URL download_single() runs.
+        worker = None
+        if venv_python is not None:
+            worker = _spawn_gytmdl_worker(venv_python, config_path, _BASE_ENV)
+
+        # Process each URL
+        for index, (line_num, url) in enumerate(urls, 1):
+            print('\n' + '=' * 70)
+            print(f'\033[33m[{index}/{total_urls}] Line {line_num}: {url[:60]}...\033[0m' if len(url) > 60 else f'\033[33m[{index}/{total_urls}] Line {line_num}: {url}\033[0m')
+            print('=' * 70)
+
+            try:
+                result = None
+                if worker is not None:
+                    result = _worker_download(worker, url)
+                    if result is None:
+                        log_warn('Batch worker stopped responding, falling back to per-URL runs')
+                        worker = None
+                if result is None:
+                    result = download_single(url, profile, _server_ready=True)
+                if result == 0:
+                    success_count += 1
+                    log_success(f'Downloaded: {url[:50]}...')
+                else:
+                    fail_count += 1
+                    failed_urls.append((line_num, url))
+                    log_error(f'Failed to download: {url[:50]}...')
+                    if not continue_on_error:
+                        break
+            except KeyboardInterrupt:
+                log_warn('Batch download interrupted by user')
+                break
+            except Exception as e:
+                fail_count += 1
+                failed_urls.append((line_num, url))
+                log_error(f'Exception: {e}')
                 if not continue_on_error:
                     break
-        except KeyboardInterrupt:
-            log_warn('Batch download interrupted by user')
-            break
-        except Exception as e:
-            fail_count += 1
-            failed_urls.append((line_num, url))
-            log_error(f'Exception: {e}')
-            if not continue_on_error:
-                break
-    
+
+        _shutdown_worker(worker)
+
     # Summary
     print('\n' + '=' * 70)
     print('\033[36m╔════════════════════════════════════════════════════════════════╗\033[0m')
@@ -424,10 +781,8 @@ def download_batch(list_file: str, profile: str = 'gytmdl', continue_on_error: b
 
 def show_help():
     """Display help message"""
-    # Set UTF-8 encoding for Windows console
-    import sys
-    if sys.platform == 'win32':
-        import io
+    # Re-wrap the Windows console only if it isn't already UTF-8 capable
+    if sys.platform == 'win32' and 'utf' not in (sys.stdout.encoding or '').lower():
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     
     print("""
@@ -440,7 +795,7 @@ def show_help():
 
 \033[33mCommands:\033[0m
   \033[32mdownload\033[0m <url> [-p PROFILE]    Download single URL
-  \033[32mbatch\033[0m <file> [-p PROFILE]       Download from URL list
+  \033[32mbatch\033[0m <file> [-p PROFILE] [-j N]  Download from URL list (N concurrent)
   \033[32mserver\033[0m                         Start/check PO token server
   \033[32mprofiles\033[0m                       List available profiles
   \033[32mcheck\033[0m                          Check dependencies and system status
@@ -488,121 +843,144 @@ def show_help():
 """)
 
 
+def _parse_profile(argv: List[str], default: str = 'gytmdl') -> str:
+    """Extract the -p/--profile value from an argument list"""
+    for flag in ('-p', '--profile'):
+        if flag in argv:
+            index = argv.index(flag)
+            if index + 1 < len(argv):
+                return argv[index + 1]
+    return default
+
+
+def _cmd_help(argv: List[str]) -> int:
+    show_help()
+    return 0
+
+
+def _cmd_download(argv: List[str]) -> int:
+    if not argv:
+        log_error('URL required')
+        print('Usage: python ytdl.py download <url> [-p PROFILE]')
+        return 1
+    return download_single(argv[0], _parse_profile(argv[1:]))
+
+
+def _parse_jobs(argv: List[str]) -> int:
+    """Extract the -j/--jobs value from an argument list"""
+    default = min(4, os.cpu_count() or 4)
+    for flag in ('-j', '--jobs'):
+        if flag in argv:
+            index = argv.index(flag)
+            if index + 1 < len(argv):
+                try:
+                    return max(1, int(argv[index + 1]))
+                except ValueError:
+                    log_warn(f'Invalid jobs value: {argv[index + 1]}, using {default}')
+    return default
+
+
+def _cmd_batch(argv: List[str]) -> int:
+    if not argv:
+        log_error('URL list file required')
+        print('Usage: python ytdl.py batch <file> [-p PROFILE] [-j JOBS]')
+        return 1
+    return download_batch(argv[0], _parse_profile(argv[1:]), jobs=_parse_jobs(argv[1:]))
+
+
+def _cmd_fix_all(argv: List[str]) -> int:
+    log_info('Fixing all profile configurations...')
+    config_dir = CONFIG_DIR
+    profiles_dir = config_dir / 'profiles'
+
+    # Build the file list once, then fix each config
+    config_files = [config_dir / f'{name}.json'
+                    for name in _scan_json_files(config_dir)]
+    config_files.extend(profiles_dir / f'{name}.json'
+                        for name in _scan_json_files(profiles_dir))
+
+    # Fixing is I/O-bound (read, parse, maybe backup + write), so fan
+    # the files out across a small thread pool
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+        results = list(executor.map(fix_config_if_needed, config_files))
+
+    fixed_count = 0
+    for config_file, was_fixed in zip(config_files, results):
+        if was_fixed:
+            label = config_file.name if config_file.parent == config_dir else f'profiles/{config_file.name}'
+            log_success(f'Fixed: {label}')
+            fixed_count += 1
+
+    if fixed_count == 0:
+        log_info('No fixes needed - all profiles are OK')
+    else:
+        log_success(f'Fixed {fixed_count} profile(s)')
+
+    print()
+    return 0
+
+
+def _cmd_check(argv: List[str]) -> int:
+    print('\n\033[36m╔═══════════════════════════════════════════════════════════╗\033[0m')
+    print('\033[36m║            System Dependency Check                     ║\033[0m')
+    print('\033[36m╚═══════════════════════════════════════════════════════════╝\033[0m')
+    print_dependency_status()
+
+    # Check server status
+    pid = is_server_running()
+    if pid and check_server_health():
+        log_success(f'PO token server running (PID: {pid})')
+    else:
+        log_warn('PO token server not running')
+        log_info('Start with: python ytdl.py server')
+
+    # Check venv
+    venv_python = ROOT_DIR / 'env' / 'Scripts' / 'python.exe'
+    if not venv_python.exists():
+        venv_python = ROOT_DIR / 'env' / 'bin' / 'python'
+
+    if venv_python.exists():
+        log_success('Virtual environment found')
+    else:
+        log_error('Virtual environment not found')
+        log_info('Run: python -m venv env')
+
+    # Check profile count
+    profiles = get_available_profiles(ROOT_DIR)
+    log_info(f'Found {len(profiles)} profile(s)')
+    print()
+    return 0
+
+
+# Command dispatch table: O(1) lookup, shared arg parsing via the handlers
+COMMANDS = {
+    'help': _cmd_help,
+    '-h': _cmd_help,
+    '--help': _cmd_help,
+    '?': _cmd_help,
+    'download': _cmd_download,
+    'batch': _cmd_batch,
+    'server': lambda argv: start_server(),
+    'profiles': lambda argv: list_profiles(),
+    'fix-all': _cmd_fix_all,
+    'check': _cmd_check,
+}
+
+
 def main():
     if len(sys.argv) < 2:
         show_help()
         return 0
-    
+
     command = sys.argv[1].lower()
-    
-    if command in ['help', '-h', '--help', '?']:
-        show_help()
-        return 0
-    
-    elif command == 'download':
-        if len(sys.argv) < 3:
-            print('[\033[31mERROR\033[0m] URL required')
-            print('Usage: python ytdl.py download <url> [-p PROFILE]')
-            return 1
-        
-        # Parse arguments
-        url = sys.argv[2]
-        profile = 'gytmdl'
-        
-        if len(sys.argv) > 3 and sys.argv[3] in ['-p', '--profile']:
-            if len(sys.argv) > 4:
-                profile = sys.argv[4]
-        
-        return download_single(url, profile)
-    
-    elif command == 'batch':
-        if len(sys.argv) < 3:
-            print('[\033[31mERROR\033[0m] URL list file required')
-            print('Usage: python ytdl.py batch <file> [-p PROFILE]')
-            return 1
-        
-        # Parse arguments
-        list_file = sys.argv[2]
-        profile = 'gytmdl'
-        
-        if len(sys.argv) > 3 and sys.argv[3] in ['-p', '--profile']:
-            if len(sys.argv) > 4:
-                profile = sys.argv[4]
-        
-        return download_batch(list_file, profile)
-    
-    elif command == 'server':
-        return start_server()
-    
-    elif command == 'profiles':
-        return list_profiles()
-    
-    elif command == 'fix-all':
-        log_info('Fixing all profile configurations...')
-        root_dir = Path(__file__).parent.absolute()
-        config_dir = root_dir / 'config'
-        
-        fixed_count = 0
-        profiles_dir = config_dir / 'profiles'
-        
-        # Fix main configs
-        for config_file in config_dir.glob('*.json'):
-            if fix_config_if_needed(config_file, create_backup=True):
-                log_success(f'Fixed: {config_file.name}')
-                fixed_count += 1
-        
-        # Fix profile configs
-        if profiles_dir.exists():
-            for config_file in profiles_dir.glob('*.json'):
-                if fix_config_if_needed(config_file, create_backup=True):
-                    log_success(f'Fixed: profiles/{config_file.name}')
-                    fixed_count += 1
-        
-        if fixed_count == 0:
-            log_info('No fixes needed - all profiles are OK')
-        else:
-            log_success(f'Fixed {fixed_count} profile(s)')
-        
-        print()
-        return 0
-    
-    elif command == 'check':
-        print('\n\033[36m╔═══════════════════════════════════════════════════════════╗\033[0m')
-        print('\033[36m║            System Dependency Check                     ║\033[0m')
-        print('\033[36m╚═══════════════════════════════════════════════════════════╝\033[0m')
-        print_dependency_status()
-        
-        # Check server status
-        pid = is_server_running()
-        if pid and check_server_health():
-            log_success(f'PO token server running (PID: {pid})')
-        else:
-            log_warn('PO token server not running')
-            log_info('Start with: python ytdl.py server')
-        
-        # Check venv
-        root_dir = Path(__file__).parent.absolute()
-        venv_python = root_dir / 'env' / 'Scripts' / 'python.exe'
-        if not venv_python.exists():
-            venv_python = root_dir / 'env' / 'bin' / 'python'
-        
-        if venv_python.exists():
-            log_success('Virtual environment found')
-        else:
-            log_error('Virtual environment not found')
-            log_info('Run: python -m venv env')
-        
-        # Check profile count
-        profiles = get_available_profiles(root_dir)
-        log_info(f'Found {len(profiles)} profile(s)')
-        print()
-        return 0
-    
-    else:
+    handler = COMMANDS.get(command)
+    if handler is None:
         log_error(f'Unknown command: {command}')
         print('Run "python ytdl.py help" for usage information')
         return 1
 
+    return handler(sys.argv[2:])
+
 
 if __name__ == '__main__':
     sys.exit(main())